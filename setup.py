@@ -30,6 +30,11 @@ requirements = [
     'bokeh'
 ]
 
+extras_requirements = {
+    'numba': ['numba'],
+    'parallel': ['joblib'],
+}
+
 test_requirements = [
     'pytest'
 ] + requirements
@@ -44,6 +49,7 @@ setup(
     url='https://github.com/mansenfranzen/tssim',
     packages=find_packages(),
     install_requires=requirements,
+    extras_require=extras_requirements,
     license="MIT license",
     zip_safe=False,
     keywords='tssim',
@@ -1,5 +1,8 @@
 """This module tests the TimeFunction class"""
 
+import timeit
+
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -21,3 +24,195 @@ def test_vectorized_no_condition(ts):
     func = lambda x: x * 2
 
     assert func(ts).equals(tssim.TimeFunction(func).generate(ts))
+
+
+def test_iterated_numba(ts):
+    pytest.importorskip("numba")
+    func = lambda x: x * 2
+    condition = lambda x: x < 10
+
+    time_func = tssim.TimeFunction(iterated=func, condition=condition,
+                                   numba_iterated=True)
+    result = time_func.generate(ts)
+
+    assert result.tolist() == [0, 2, 4, 6, 8]
+    assert result.index.equals(ts.index[:5])
+
+
+def test_vectorized_condition(ts):
+    func = lambda x: x * 2
+    condition = lambda x: x > 10
+
+    result = tssim.TimeFunction(func, condition=condition).generate(ts)
+    expected = func(ts)[condition(func(ts))]
+
+    assert expected.equals(result)
+
+
+def test_resolved_function_cached(ts):
+    time_func = tssim.TimeFunction(tssim.random.rand)
+    time_func.generate(ts)
+    resolved = time_func._resolved_vec
+
+    assert resolved[0] is tssim.random.rand
+    assert len(time_func.generate(ts)) == len(ts)
+    assert time_func._resolved_vec is resolved
+
+
+def test_resolved_function_reassigned(ts):
+    time_func = tssim.TimeFunction(lambda x: x * 2)
+    time_func.generate(ts)
+
+    time_func.vectorized = lambda x: x * 3
+    assert (ts * 3).equals(time_func.generate(ts))
+
+
+def test_size_kwarg_function_cached(ts):
+    func = lambda size=None: np.ones(size)
+    time_func = tssim.TimeFunction(func)
+    time_func.generate(ts)
+
+    assert time_func._resolved_vec[0] is func
+
+
+def test_function_generator_not_cached(ts):
+    generator = lambda: (lambda x: x * 2)
+    time_func = tssim.TimeFunction(generator)
+
+    assert (ts * 2).equals(time_func.generate(ts))
+    assert time_func._resolved_vec[0] is None
+
+
+def test_iterated_condition(ts):
+    func = lambda x: x * 2
+    condition = lambda x: x < 10
+
+    result = tssim.TimeFunction(iterated=func, condition=condition).generate(ts)
+
+    assert result.tolist() == [0, 2, 4, 6, 8]
+    assert result.dtype == np.int64
+    assert result.index.equals(ts.index[:5])
+
+
+def test_iterated_condition_dtypes(ts):
+    condition = lambda x: x != "e"
+
+    floats = tssim.TimeFunction(iterated=lambda x: x / 2, condition=condition)
+    assert floats.generate(ts).dtype == np.float64
+
+    strings = tssim.TimeFunction(iterated=lambda x: "abcdefghij"[x],
+                                 condition=condition)
+    assert strings.generate(ts).tolist() == ["a", "b", "c", "d"]
+
+    mixed = tssim.TimeFunction(iterated=lambda x: "a" if x == 2 else x / 2,
+                               condition=lambda x: x != 2)
+    assert mixed.generate(ts).tolist() == [0, 0.5, "a", 1.5]
+
+
+def test_iterated_condition_always_true(ts):
+    func = lambda x: x * 2
+    condition = lambda x: x >= 0
+
+    result = tssim.TimeFunction(iterated=func, condition=condition).generate(ts)
+
+    assert result.tolist() == (ts * 2).tolist()
+
+
+def test_multiple_conditions(ts):
+    func = lambda x: x * 2
+    conditions = [lambda x: x > 2, lambda x: x < 12]
+
+    vectorized = tssim.TimeFunction(func, condition=conditions).generate(ts)
+    assert vectorized.tolist() == [4, 6, 8, 10]
+
+    conditions = [lambda x: x >= 0, lambda x: x < 12]
+    iterated = tssim.TimeFunction(iterated=func, condition=conditions)
+    assert iterated.generate(ts).tolist() == [0, 2, 4, 6, 8, 10]
+
+
+def test_generate_into(ts):
+    func = lambda x: x * 2
+    out = np.zeros(len(ts))
+
+    count = tssim.TimeFunction(func).generate_into(ts, out)
+    assert count == len(ts)
+    assert out.tolist() == func(ts).tolist()
+
+    time_func = tssim.TimeFunction(func, condition=lambda x: x > 10)
+    count = time_func.generate_into(ts, out)
+    assert not time_func.contiguous
+    assert out[:count].tolist() == [12, 14, 16, 18]
+
+
+def test_invalid_function_arguments(ts):
+    with pytest.raises(ValueError):
+        tssim.TimeFunction(lambda x, y: x + y).generate(ts)
+
+
+def test_function_kind_cached():
+    from tssim.core import function
+
+    func = lambda x: x
+    assert function._function_kind(func) == "constant"
+    assert function._function_kinds[func] == "constant"
+
+
+def test_iterated_numba_invalid(ts):
+    pytest.importorskip("numba")
+    conditions = [lambda x: x >= 0, lambda x: x < 10]
+
+    with pytest.raises(ValueError):
+        tssim.TimeFunction(iterated=lambda x: x, condition=conditions,
+                           numba_iterated=True)
+
+    generator = lambda: (lambda x: x * 2)
+    time_func = tssim.TimeFunction(iterated=generator,
+                                   condition=lambda x: x < 10,
+                                   numba_iterated=True)
+    with pytest.raises(ValueError):
+        time_func.generate(ts)
+
+
+def test_iterated_condition_python_scalars(ts):
+    arguments = []
+
+    def func(x):
+        arguments.append(x)
+        return x * 2
+
+    tssim.TimeFunction(iterated=func, condition=lambda x: x < 10).generate(ts)
+
+    assert all(type(x) is int for x in arguments)
+
+
+def test_iterated_condition_speed():
+    ts = pd.Series(range(100000))
+    func = lambda x: x * 2
+    condition = lambda x: x >= 0
+    time_func = tssim.TimeFunction(iterated=func, condition=condition)
+
+    def plain_loop():
+        for x in ts:
+            if not condition(func(x)):
+                break
+
+    # best of several runs to reduce timing noise
+    loop_time = min(timeit.repeat(plain_loop, number=1, repeat=3))
+    generate_time = min(timeit.repeat(lambda: time_func.generate(ts),
+                                      number=1, repeat=3))
+
+    assert generate_time < 3 * loop_time
+
+
+def test_multiple_conditions_short_circuit(ts):
+    calls = []
+
+    def counted(x):
+        calls.append(x)
+        return True
+
+    conditions = [lambda x: x < 3, counted]
+    time_func = tssim.TimeFunction(iterated=lambda x: x, condition=conditions)
+
+    assert time_func.generate(ts).tolist() == [0, 1, 2]
+    assert calls == [0, 1, 2]
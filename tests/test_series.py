@@ -0,0 +1,108 @@
+"""This module tests the TimeSeries class"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import tssim
+
+
+@pytest.fixture
+def ts():
+    """Setup test data.
+
+    """
+
+    ts = tssim.TimeSeries(start="2017-04-12", periods=20, freq="D")
+    ts.add("double", lambda x: x * 2)
+    ts.add("constant", lambda x: x * 0 + 1, start="2017-04-15",
+           end="2017-04-20")
+
+    return ts
+
+
+def test_generate_sums_tracks(ts):
+    result = ts.generate()
+
+    track_values = [x.values for x in result.tracks.values()]
+    expected = pd.concat(track_values, axis=1).sum(axis=1)
+
+    assert result.values.index.equals(expected.index)
+    assert np.allclose(result.values.values, expected.values)
+
+
+def test_generate_parallel(ts):
+    pytest.importorskip("joblib")
+
+    serial = ts.generate()
+    parallel = ts.generate(n_jobs=2)
+
+    assert list(parallel.tracks) == list(serial.tracks)
+    assert serial.values.equals(parallel.values)
+
+
+def test_generate_shared_index():
+    ts = tssim.TimeSeries(start="2017-04-12", periods=20, freq="D")
+    ts.add("double", lambda x: x * 2)
+    ts.add("triple", lambda x: x * 3)
+
+    result = ts.generate()
+
+    assert result.values.index.equals(ts.index)
+    assert result.values.dtype == np.int64
+    assert result.values.tolist() == [x * 5 for x in range(1, 21)]
+
+
+def test_generate_shared_index_dtypes():
+    ts = tssim.TimeSeries(start="2017-04-12", periods=20, freq="D")
+    ts.add("even", lambda x: x % 2 == 0)
+    ts.add("odd", lambda x: x % 2 == 1)
+
+    result = ts.generate()
+    assert result.values.dtype == np.int64
+    assert (result.values == 1).all()
+
+    ts = tssim.TimeSeries(start="2017-04-12", periods=20, freq="D")
+    ts.add("first", lambda x: x.astype(str))
+    ts.add("second", lambda x: x.astype(str))
+
+    result = ts.generate()
+
+    track_values = [x.values for x in result.tracks.values()]
+    expected = pd.concat(track_values, axis=1).sum(axis=1)
+    assert result.values.equals(expected)
+
+
+def test_generate_keeps_inf(ts):
+    ts.add("inf", lambda x: 1 / (x - 1), end="2017-04-20")
+
+    result = ts.generate()
+
+    track_values = [x.values for x in result.tracks.values()]
+    expected = pd.concat(track_values, axis=1).sum(axis=1)
+
+    assert np.isinf(result.values.iloc[0])
+    assert result.values.equals(expected)
+
+
+def test_generate_shared_index_keeps_inf():
+    ts = tssim.TimeSeries(start="2017-04-12", periods=20, freq="D")
+    ts.add("double", lambda x: x * 2)
+    ts.add("inf", lambda x: 1 / (x - 1))
+
+    result = ts.generate()
+
+    assert np.isinf(result.values.iloc[0])
+    assert result.values.iloc[1:].tolist() == [x * 2 + 1 / (x - 1)
+                                               for x in range(2, 21)]
+
+
+def test_generate_stacked_dtypes():
+    ts = tssim.TimeSeries(start="2017-04-12", periods=20, freq="D")
+    ts.add("first", lambda x: x * 2, end="2017-04-25")
+    ts.add("second", lambda x: x * 3, start="2017-04-12", end="2017-04-25")
+
+    result = ts.generate()
+
+    assert result.values.dtype == np.int64
+    assert result.values.tolist() == [x * 5 for x in range(1, 15)]
@@ -0,0 +1,59 @@
+"""This module tests the TimeTrack class"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import tssim
+
+
+@pytest.fixture
+def ts():
+    """Setup test data.
+
+    """
+
+    return tssim.TimeSeries(start="2017-04-12", periods=20, freq="D")
+
+
+def test_generate_keeps_integer_dtype(ts):
+    ts.add("ints", tssim.random.randint(low=1, high=10))
+    values = ts["ints"].generate().values
+
+    assert values.dtype == np.int64
+    assert ((values >= 1) & (values < 10)).all()
+
+
+def test_generate_keeps_object_dtype(ts):
+    ts.add("strings", tssim.random.choice(["a", "b"]))
+    values = ts["strings"].generate().values
+
+    assert values.dtype == object
+    assert set(values) <= {"a", "b"}
+
+
+def test_generate_float_chunks(ts):
+    ts.add("floats", percentage=0.5, iterated=lambda x: x / 2,
+           condition=lambda x: x < 2)
+    values = ts["floats"].generate().values
+
+    assert values.dtype == np.float64
+    assert values.dropna().tolist() == [0.5, 1, 1.5] * 4
+
+
+def test_generate_vectorized_own_index(ts):
+    units = pd.Series(np.arange(1, 21), ts.index)
+    filtered = lambda x: (x * 1.0)[x % 3 == 1]
+    reordered = lambda x: (x * 1.0).iloc[::-1].iloc[:4]
+
+    ts.add("filtered", filtered, default=None)
+    ts.add("reordered", reordered, default=None)
+
+    # values of the first chunk keep the index returned by the function
+    expected = filtered(units)
+    values = ts["filtered"].generate().values
+    assert values.iloc[:len(expected)].equals(expected)
+
+    expected = reordered(units)
+    values = ts["reordered"].generate().values
+    assert values.iloc[:len(expected)].equals(expected)
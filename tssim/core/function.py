@@ -1,7 +1,107 @@
 """This module contains the TimeFunction"""
 
+import weakref
+
+import numpy as np
 import pandas as pd
-from ..functions.wrapper import BaseWrapper
+from ..functions.wrapper import BaseWrapper, NumpyWrapper
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+_numba_kernel = None
+
+# caches the kind of functions without keeping them alive
+_function_kinds = weakref.WeakKeyDictionary()
+
+
+def _classify_function(function):
+    """Classify `function` by its arguments. Functions without arguments are
+    'generator's or 'size_kwarg' functions if they take a `size` keyword.
+    Functions with one argument and objects without code are 'constant'.
+
+    """
+
+    try:
+        # get number of optional keyword arguments
+        try:
+            kwargs_count = len(function.__defaults__)
+        except TypeError:
+            kwargs_count = 0
+
+        arg_names = function.__code__.co_varnames
+        karg_count = len(arg_names) - kwargs_count
+
+    except AttributeError:
+        return "constant"
+
+    # not more than one karg allowed
+    if karg_count > 1:
+        raise ValueError("Function passed to TimeFunction needs to have 0 "
+                         "arguments for a function generator or 1 arugment"
+                         " for a constant function. Passed function has {}"
+                         " arguments.".format(karg_count))
+
+    # check for functions with no kargs and a size kwarg
+    elif karg_count == 0 and "size" in arg_names:
+        return "size_kwarg"
+
+    # finalized function
+    elif karg_count == 1:
+        return "constant"
+
+    else:
+        return "generator"
+
+
+def _function_kind(function):
+    """Return the kind of `function`. The kind is cached per function object
+    to skip introspection on repeated calls.
+
+    """
+
+    try:
+        return _function_kinds[function]
+    except (KeyError, TypeError):
+        pass
+
+    kind = _classify_function(function)
+
+    try:
+        _function_kinds[function] = kind
+    except TypeError:
+        # function can not be weakly referenced or hashed
+        pass
+
+    return kind
+
+
+def _get_numba_kernel():
+    """Lazily compile the numba kernel for the conditional iterated loop.
+    Returns the number of values written to `out` before the condition
+    failed.
+
+    """
+
+    global _numba_kernel
+
+    if _numba_kernel is None:
+        @numba.njit
+        def kernel(time_func, condition, time_arr, out):
+            for i in range(time_arr.shape[0]):
+                value = time_func(time_arr[i])
+                if not condition(value):
+                    return i
+                out[i] = value
+
+            return time_arr.shape[0]
+
+        _numba_kernel = kernel
+
+    return _numba_kernel
 
 
 class TimeFunction:
@@ -9,7 +109,8 @@ class TimeFunction:
     functions.
     
     The `condition` defines the valid range of values. Any values which do not
-    satisfy the condition are discarded.
+    satisfy the condition are discarded. Multiple conditions may be given as a
+    list or tuple which all need to be satisfied.
     
     In addition, a TimeFunction may have `vectorized` and `iterated` implemen-
     tations. The iterated function is particularly interesting when a 
@@ -17,9 +118,14 @@ class TimeFunction:
     function will end to compute further values. This has performance benefits
     on large time series.
     
+    If `numba_iterated` is set, the iterated function and the condition are
+    compiled with numba and the conditional loop runs in nopython mode. Both
+    need to be numba compatible scalar functions.
+    
     """
 
-    def __init__(self, vectorized=None, iterated=None, condition=None):
+    def __init__(self, vectorized=None, iterated=None, condition=None,
+                 numba_iterated=False):
         """Initializes TimeFunction instance.
         
         """
@@ -30,7 +136,49 @@ class TimeFunction:
 
         self.vectorized = vectorized
         self.iterated = iterated
-        self.condition = condition
+        self.condition = self._combine_conditions(condition)
+
+        if numba_iterated and numba is None:
+            raise ImportError("'numba_iterated' requires numba to be "
+                              "installed.")
+
+        if numba_iterated and isinstance(condition, (list, tuple)):
+            raise ValueError("'numba_iterated' does not support multiple "
+                             "conditions. Please combine them into a single "
+                             "numba compatible condition.")
+
+        self.numba_iterated = numba_iterated
+        self._numba_compiled = {}
+
+        self._resolved_vec = self._resolved_iter = None
+
+    @staticmethod
+    def _combine_conditions(condition):
+        """Fuse a list or tuple of conditions into a single condition which
+        reduces all boolean masks with one logical and. Single values are
+        checked condition by condition until one fails.
+
+        """
+
+        if not isinstance(condition, (list, tuple)):
+            return condition
+
+        if not condition:
+            return None
+
+        if len(condition) == 1:
+            return condition[0]
+
+        def combined(values):
+            # single values of the iterated loop short circuit
+            if np.ndim(values) == 0:
+                return all(cond(values) for cond in condition)
+
+            masks = [np.asarray(cond(values), dtype=bool)
+                     for cond in condition]
+            return np.logical_and.reduce(masks)
+
+        return combined
 
     def generate(self, time_units):
         """Apply a time function to given `time_units`. 
@@ -56,80 +204,206 @@ class TimeFunction:
         
         """
 
-        if issubclass(function.__class__, BaseWrapper):
+        if isinstance(function, NumpyWrapper):
+            return function._call
+
+        if isinstance(function, BaseWrapper):
             return function()
 
-        try:
-            # get number of optional keyword arguments
-            try:
-                kwargs_count = len(function.__defaults__)
-            except TypeError:
-                kwargs_count = 0
+        kind = _function_kind(function)
 
-            arg_names = function.__code__.co_varnames
-            karg_count = len(arg_names) - kwargs_count
+        if kind == "size_kwarg":
+            return lambda x: function(size=x.shape[0])
 
-        except AttributeError:
+        elif kind == "constant":
             return function
 
-        # not more than one karg allowed
-        if karg_count > 1:
-            raise ValueError("Function passed to TimeFunction needs to have 0 "
-                             "arguments for a function generator or 1 arugment"
-                             " for a constant function. Passed function has {}"
-                             " arguments.".format(karg_count))
+        else:
+            return self._evaluate_function(function())
 
-        # check for functions with no kargs and a size kwarg
-        elif karg_count == 0 and "size" in arg_names:
-            return lambda x: function(size=x.shape[0])
+    @staticmethod
+    def _is_pure(function):
+        """Check if the resolved time function of `function` may be cached.
+        Function generators are evaluated anew on each call because they may
+        return different functions. Wrappers declare it via `is_pure`.
 
-        # finalized function
-        elif karg_count == 1:
-            return function
+        """
+
+        if isinstance(function, BaseWrapper):
+            return function.is_pure
+
+        return _function_kind(function) != "generator"
+
+    def _resolve(self, function, cached):
+        """Return a pair of `function` and its resolved time function. The
+        `cached` pair is reused if it belongs to `function`. The first item is
+        None if the resolved time function must not be cached.
+
+        """
+
+        if cached is not None and cached[0] is function:
+            return cached
+
+        resolved = self._evaluate_function(function)
+        if not self._is_pure(function):
+            function = None
+
+        return function, resolved
+
+    @property
+    def contiguous(self):
+        """Return True if generated values always belong to the leading time
+        units. This only holds for the conditional iterated loop because
+        vectorized functions may return values for arbitrary time units.
+        
+        """
+
+        return bool(self.condition and self.iterated)
+
+    def generate_into(self, time_units, out):
+        """Apply a time function to given `time_units` and write the values
+        into the preallocated numpy array `out`. Return the number of values
+        written to the beginning of `out`.
+        
+        Values dropped by a vectorized condition are skipped, hence written
+        values only correspond to the leading time units if `contiguous` is 
+        True.
+        
+        """
+
+        if self.condition and self.iterated:
+            return self._fill_iterated(self._resolve_iterated(), time_units,
+                                       out)
+
+        if self.vectorized:
+            time_values = self._vectorized_values(time_units)
+
+            if self.condition:
+                mask = np.asarray(self.condition(time_values), dtype=bool)
+                count = np.count_nonzero(mask)
+                out[:count] = np.asarray(time_values).compress(mask)
+                return count
 
         else:
-            return self._evaluate_function(function())
+            time_values = time_units.apply(self._resolve_iterated())
+
+        count = len(time_values)
+        out[:count] = np.asarray(time_values)
+
+        return count
+
+    def _resolve_iterated(self):
+        """Return the resolved iterated time function. Caches it if possible.
+        
+        """
+
+        self._resolved_iter = self._resolve(self.iterated, self._resolved_iter)
+        return self._resolved_iter[1]
+
+    def _resolve_vectorized(self):
+        """Return the resolved vectorized time function. Caches it if 
+        possible.
+        
+        """
+
+        self._resolved_vec = self._resolve(self.vectorized, self._resolved_vec)
+        return self._resolved_vec[1]
+
+    def _vectorized_values(self, time_units):
+        """Apply the vectorized time function to `time_units` and return all
+        values as pd.Series without applying the condition.
+        
+        """
+
+        time_values = self._resolve_vectorized()(time_units)
+
+        if not isinstance(time_values, pd.Series):
+            time_values = pd.Series(time_values, index=time_units.index,
+                                    copy=False)
+
+        return time_values
 
     def _generate_vectorized(self, time_units):
         """Generate values in a vectorized fashion.
         
         """
 
-        time_func = self._evaluate_function(self.vectorized)
-        time_values = time_func(time_units)
-
-        if not issubclass(time_values.__class__, pd.Series):
-            time_values = pd.Series(time_values, index=time_units.index)
+        time_values = self._vectorized_values(time_units)
 
         if self.condition:
-            mask = self.condition(time_values)
-            time_values = time_values[mask]
+            mask = np.asarray(self.condition(time_values), dtype=bool)
+            values = np.asarray(time_values).compress(mask)
+            index = time_values.index[mask]
+            time_values = pd.Series(values, index=index, name=time_values.name,
+                                    copy=False)
 
         return time_values
 
     def _generate_iterated(self, time_units):
         """Generate values in an iterated fashion. 
         
-        Uses generator to return values one after another as long as condition
-        holds.
+        Computes values one after another as long as condition holds.
         
         """
 
-        time_func = self._evaluate_function(self.iterated)
-
-        if self.condition:
-            def yield_values():
-                iterator = iter(time_units)
-                current_val = time_func(next(iterator))
-                while self.condition(current_val):
-                    yield current_val
-                    current_val = time_func(next(iterator))
+        time_func = self._resolve_iterated()
 
-            values = list(yield_values())
-            index = time_units[:len(values)].index
-            time_values = pd.Series(values, index)
+        if not self.condition:
+            return time_units.apply(time_func)
 
+        if self.numba_iterated:
+            values = np.empty(len(time_units), dtype=np.float64)
+            count = self._fill_iterated(time_func, time_units, values)
+            values = values[:count]
         else:
-            time_values = time_units.apply(time_func)
+            values = list(self._iterate_values(time_func, time_units))
 
-        return time_values
+        return pd.Series(values, index=time_units.index[:len(values)],
+                         copy=False)
+
+    def _iterate_values(self, time_func, time_units):
+        """Yield values of `time_func` as long as the condition holds.
+
+        """
+
+        for time_unit in time_units:
+            current_val = time_func(time_unit)
+            if not self.condition(current_val):
+                break
+
+            yield current_val
+
+    def _fill_iterated(self, time_func, time_units, out):
+        """Write values of `time_func` into `out` as long as the condition
+        holds. Return the number of written values.
+
+        """
+
+        if self.numba_iterated:
+            if self._resolved_iter[0] is None:
+                raise ValueError("'numba_iterated' requires a constant "
+                                 "iterated function. Function generators "
+                                 "would be compiled anew on each call.")
+
+            kernel = _get_numba_kernel()
+            return kernel(self._compile_numba(time_func),
+                          self._compile_numba(self.condition),
+                          time_units.values, out)
+
+        count = 0
+        for current_val in self._iterate_values(time_func, time_units):
+            out[count] = current_val
+            count += 1
+
+        return count
+
+    def _compile_numba(self, function):
+        """Compile `function` with numba once and reuse it on subsequent
+        calls.
+
+        """
+
+        if function not in self._numba_compiled:
+            self._numba_compiled[function] = numba.njit(function)
+
+        return self._numba_compiled[function]
@@ -2,10 +2,16 @@
 
 import itertools
 
+import numpy as np
 import pandas as pd
 from bokeh.palettes import Category10
 from bokeh.plotting import figure, show, save
 
+try:
+    from joblib import Parallel, delayed
+except ImportError:
+    Parallel = None
+
 from . import track
 
 
@@ -100,19 +106,114 @@ class TimeSeries:
 
         self.tracks[name] = track.TimeTrack(self, *args, **kwargs)
 
-    def generate(self):
+    def generate(self, n_jobs=1):
         """Generate actual time series values for all TimeTracks. Return 
         TimeSeriesResult with TimeTracks definitions and summed time series
         values of all TimeTracks.
         
+        TimeTracks are generated in parallel threads via joblib if `n_jobs` is
+        not 1. Random values drawn from numpy's global random state are not
+        reproducible via seeding in that case.
+        
         """
 
-        tracks = {name: track.generate() for name, track in self.tracks.items()}
+        if n_jobs == 1 or len(self.tracks) < 2:
+            tracks = {name: track.generate()
+                      for name, track in self.tracks.items()}
+
+        else:
+            if Parallel is None:
+                raise ImportError("Parallel generation with 'n_jobs' other "
+                                  "than 1 requires joblib to be installed.")
+
+            parallel = Parallel(n_jobs=n_jobs, prefer="threads")
+            results = parallel(delayed(track.generate)()
+                               for track in self.tracks.values())
+            tracks = dict(zip(self.tracks, results))
+
         track_values = [x.values for x in tracks.values()]
-        time_series_values = pd.concat(track_values, axis=1).sum(axis=1)
+        time_series_values = self._sum_track_values(track_values)
 
         return TimeSeriesResult(tracks, time_series_values)
 
+    def _sum_track_values(self, track_values):
+        """Sum up all track values aligned on the TimeSeries index without
+        building an intermediate DataFrame. Missing values are ignored.
+        
+        If all tracks share the TimeSeries index, values are added in place
+        into one array. Otherwise, values are stacked into a 2D array with one
+        row per track and reduced along the first axis. Falls back to pandas
+        for non-numeric values or if any track contains time values not part
+        of the TimeSeries index.
+        
+        """
+
+        dtype = self._result_dtype(track_values)
+        if dtype is None:
+            return pd.concat(track_values, axis=1).sum(axis=1)
+
+        # tracks sharing the TimeSeries index are accumulated in place
+        if all(values.index.equals(self.index) for values in track_values):
+            total = track_values[0].values.astype(dtype)
+            if dtype.kind == "f":
+                total[np.isnan(total)] = 0
+
+            for values in track_values[1:]:
+                values = values.values
+                if dtype.kind == "f":
+                    missing = np.isnan(values)
+                    if missing.any():
+                        values = np.where(missing, 0, values)
+
+                np.add(total, values, out=total)
+
+            return pd.Series(total, index=self.index, copy=False)
+
+        stack = np.zeros((len(track_values), self.index.shape[0]), dtype=dtype)
+        covered = np.zeros(self.index.shape[0], dtype=bool)
+
+        for row, values in zip(stack, track_values):
+            indexer = self.index.get_indexer(values.index)
+            if (indexer == -1).any():
+                return pd.concat(track_values, axis=1).sum(axis=1)
+
+            row[indexer] = values.values
+            covered[indexer] = True
+
+        if dtype.kind == "f":
+            total = np.nansum(stack, axis=0)
+        else:
+            total = stack.sum(axis=0)
+
+        # tracks not covering all summed time values are aligned with missing
+        # values by pandas which yields floats
+        covered_count = np.count_nonzero(covered)
+        if any(values.shape[0] < covered_count for values in track_values):
+            total = total.astype(np.float64)
+
+        return pd.Series(total[covered], index=self.index[covered])
+
+    @staticmethod
+    def _result_dtype(track_values):
+        """Return the dtype of summed track values. Booleans are summed as
+        integers like pandas does. Return None if there are no track values
+        or they are not numeric.
+        
+        """
+
+        try:
+            dtype = np.result_type(*[values.dtype for values in track_values])
+        except (TypeError, ValueError):
+            return None
+
+        if dtype.kind == "b":
+            return np.dtype(np.int64)
+
+        if dtype.kind not in "iuf":
+            return None
+
+        return dtype
+
     def __getitem__(self, item):
         """Provide convenient label access to TimeTracks of current TimeSeries.
 
@@ -78,6 +78,13 @@ class TimeTrack:
         units_free = int(units_total * self.percentage)
         units_spare = units_total - units_free
 
+        # contiguous time functions with float values write all further
+        # chunks directly into one preallocated buffer while remembering the
+        # index positions of written values, which are the leading units of
+        # each chunk
+        contiguous = self.time_function.contiguous
+        values, positions = None, None
+
         # generate values until no free units are available
         while units_used < units_free and units_current < units_total:
             # get current time series index with values
@@ -86,19 +93,39 @@ class TimeTrack:
             generate_from = pd.Series(current_values, current_index)
 
             # generate values from time function
-            generated_values = self.time_function.generate(generate_from)
-            generated.append(generated_values)
+            if values is not None:
+                units_generated = self.time_function.generate_into(
+                    generate_from, values[units_used:])
+            else:
+                generated_values = self.time_function.generate(generate_from)
+                generated.append(generated_values)
+                units_generated = generated_values.shape[0]
+
+                if contiguous and generated_values.dtype == np.float64:
+                    values = np.empty(units_total, dtype=np.float64)
+                    positions = np.empty(units_total, dtype=np.intp)
+                    values[:units_generated] = generated_values.values
+
+            if positions is not None:
+                positions[units_used:units_used + units_generated] = \
+                    np.arange(units_current, units_current + units_generated)
+
             generated_cnt += 1
 
             # increase unit counter
-            units_generated = generated_values.shape[0]
             units_used += units_generated
             units_used_avg = (units_free / (units_used / generated_cnt))
             units_diff = int(units_spare / (units_used_avg + 1))
             units_current += units_generated + units_diff
 
         # concatenate all sub time series values
-        ts_values = pd.concat(generated)
+        if len(generated) == 1 and generated_cnt == 1:
+            ts_values = generated[0]
+        elif values is not None:
+            ts_index = self.index[positions[:units_used]]
+            ts_values = pd.Series(values[:units_used], ts_index, copy=False)
+        else:
+            ts_values = pd.concat(generated)
 
         # add default values if required
         if self.default is not None:
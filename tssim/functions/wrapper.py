@@ -2,7 +2,14 @@
 
 
 class BaseWrapper(object):
-    """Define base template for function wrapper classes. """
+    """Define base template for function wrapper classes. 
+    
+    `is_pure` states whether calling the wrapper always returns an equivalent
+    function, which allows TimeFunction to cache the returned function.
+    
+    """
+
+    is_pure = True
 
     def __init__(self, func):
         self.func = func
@@ -30,6 +37,9 @@ class NumpyWrapper(BaseWrapper):
         super(NumpyWrapper, self).__init__(func)
         self.size = size
 
+        # resolve the size dispatch once for argument-less usage
+        self._call = self()
+
     def __call__(self, *args, **kwargs):
 
         if self.size == "arg":